@@ -23,21 +23,25 @@ struct PrivacyConfig: Codable, Equatable {
 
 struct AppConfig: Codable, Equatable {
     var updateIntervalSeconds: Int
+    var adaptivePolling: Bool
     var startOnLogin: Bool
     var privacy: PrivacyConfig
 
     enum CodingKeys: String, CodingKey {
         case updateIntervalSeconds = "update_interval_seconds"
+        case adaptivePolling = "adaptive_polling"
         case startOnLogin = "start_on_login"
         case privacy
     }
 
     init(
         updateIntervalSeconds: Int = 5,
+        adaptivePolling: Bool = false,
         startOnLogin: Bool = true,
         privacy: PrivacyConfig = PrivacyConfig()
     ) {
         self.updateIntervalSeconds = updateIntervalSeconds
+        self.adaptivePolling = adaptivePolling
         self.startOnLogin = startOnLogin
         self.privacy = privacy
     }
@@ -45,6 +49,7 @@ struct AppConfig: Codable, Equatable {
     init(from decoder: Decoder) throws {
         let container = try decoder.container(keyedBy: CodingKeys.self)
         updateIntervalSeconds = try container.decodeIfPresent(Int.self, forKey: .updateIntervalSeconds) ?? 5
+        adaptivePolling = try container.decodeIfPresent(Bool.self, forKey: .adaptivePolling) ?? false
         startOnLogin = try container.decodeIfPresent(Bool.self, forKey: .startOnLogin) ?? true
         privacy = try container.decodeIfPresent(PrivacyConfig.self, forKey: .privacy) ?? PrivacyConfig()
     }
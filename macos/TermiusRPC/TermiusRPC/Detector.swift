@@ -1,100 +1,160 @@
 import AppKit
 import CoreGraphics
 
+private struct WindowScan {
+    /// Title of the preferred Termius window; "" if windows exist but none has a title.
+    let title: String?
+    let hasOnScreenWindows: Bool
+}
+
 final class TermiusDetector {
+    // CGWindowList keys, bridged once instead of on every lookup.
+    private static let ownerPIDKey = kCGWindowOwnerPID as NSString
+    private static let layerKey = kCGWindowLayer as NSString
+    private static let nameKey = kCGWindowName as NSString
+    private static let isOnscreenKey = kCGWindowIsOnscreen as NSString
+
+    private static let knownBundleIDs: Set<String> = [
+        "com.termius.mac",         // Mac App Store
+        "com.termius.Termius",     // Direct download variant
+        "com.termius-dmg.mac",     // DMG install variant
+    ]
+
+    private static let ownBundleID = Bundle.main.bundleIdentifier ?? "com.systemlukas.termiusrpc"
+
     /// Whether we've already shown the permission prompt this session.
     private var hasPromptedForPermission = false
 
+    /// Last Termius process we found. Reused until it terminates, but only
+    /// if it has a known bundle ID; name-only matches are rechecked each poll
+    /// so the real Termius is picked up as soon as it launches.
+    private var cachedApp: NSRunningApplication?
+
+    /// PIDs of Termius processes reported as quit, ignored until they're gone.
+    private var terminatedPIDs: Set<pid_t> = []
+
+    /// Last window title we parsed and its result, reused while the title is unchanged.
+    private var lastParsed: (title: String?, state: TermiusState)?
+
     /// Detect the current Termius state by checking processes and window titles.
     func detect() -> TermiusState {
         guard let app = findTermiusProcess() else {
             return .closed
         }
 
-        let title = getWindowTitle(pid: app.processIdentifier)
+        let windows = scanWindows(pid: app.processIdentifier)
+        let title = windows.title
 
         // If Termius is running with on-screen windows but we got no titles,
         // we likely lack Screen Recording permission.
         if title == nil || title == "" {
-            if !hasPromptedForPermission && hasOnScreenWindows(pid: app.processIdentifier) {
+            if !hasPromptedForPermission && windows.hasOnScreenWindows {
                 hasPromptedForPermission = true
                 promptForScreenRecordingPermission()
             }
         }
 
-        return TitleParser.parse(title)
+        if let lastParsed, lastParsed.title == title {
+            return lastParsed.state
+        }
+        let state = TitleParser.parse(title)
+        lastParsed = (title, state)
+        return state
     }
 
-    /// Check if Termius is currently running.
+    /// Check if Termius is currently running, reusing the cached process while it's alive.
     private func findTermiusProcess() -> NSRunningApplication? {
-        let knownBundleIDs = [
-            "com.termius.mac",         // Mac App Store
-            "com.termius.Termius",     // Direct download variant
-            "com.termius-dmg.mac",     // DMG install variant
-        ]
-        for bundleID in knownBundleIDs {
-            let apps = NSRunningApplication.runningApplications(withBundleIdentifier: bundleID)
-            if let app = apps.first { return app }
+        if let app = cachedApp, !app.isTerminated, Self.hasKnownBundleID(app) {
+            return app
         }
+        cachedApp = scanForTermiusProcess()
+        return cachedApp
+    }
 
-        // Fallback: search by name, but exclude ourselves
-        let ownBundleID = Bundle.main.bundleIdentifier ?? "com.systemlukas.termiusrpc"
-        return NSWorkspace.shared.runningApplications.first { app in
-            let name = (app.localizedName ?? "").lowercased()
-            let bundleID = app.bundleIdentifier ?? ""
-            return name.contains("termius") && bundleID != ownBundleID
+    /// Record that `app` quit. It may not report isTerminated yet, so drop it
+    /// from the cache and skip it in scans until it leaves the running list.
+    func processTerminated(_ app: NSRunningApplication) {
+        terminatedPIDs.insert(app.processIdentifier)
+        if cachedApp?.processIdentifier == app.processIdentifier {
+            cachedApp = nil
         }
     }
 
-    /// Get the title of the frontmost Termius window using CGWindowList.
-    private func getWindowTitle(pid: pid_t) -> String? {
-        guard let windowList = CGWindowListCopyWindowInfo(
-            [.optionAll, .excludeDesktopElements],
-            kCGNullWindowID
-        ) as? [[String: Any]] else {
-            return nil
-        }
+    /// Whether `app` is Termius, using the same rules as the process scan.
+    static func isTermius(_ app: NSRunningApplication) -> Bool {
+        hasKnownBundleID(app) || matchesTermiusName(app)
+    }
 
-        let termiusWindows = windowList.filter { info in
-            let ownerPID = info[kCGWindowOwnerPID as String] as? pid_t
-            let layer = info[kCGWindowLayer as String] as? Int
-            return ownerPID == pid && layer == 0
-        }
+    private static func hasKnownBundleID(_ app: NSRunningApplication) -> Bool {
+        guard let bundleID = app.bundleIdentifier else { return false }
+        return knownBundleIDs.contains(bundleID)
+    }
 
-        // Prefer on-screen windows with titles, then any window with a title
-        let onScreen = termiusWindows.filter {
-            ($0[kCGWindowIsOnscreen as String] as? Bool) == true
-        }
+    /// Fallback: match by name, but exclude ourselves.
+    private static func matchesTermiusName(_ app: NSRunningApplication) -> Bool {
+        guard app.bundleIdentifier != ownBundleID, let name = app.localizedName else { return false }
+        return name.range(of: "termius", options: .caseInsensitive) != nil
+    }
 
-        for window in onScreen {
-            if let name = window[kCGWindowName as String] as? String, !name.isEmpty {
-                return name
-            }
+    /// Search the running applications for Termius in a single pass,
+    /// preferring known bundle IDs over a match by name.
+    private func scanForTermiusProcess() -> NSRunningApplication? {
+        let apps = NSWorkspace.shared.runningApplications
+        if !terminatedPIDs.isEmpty {
+            terminatedPIDs.formIntersection(apps.map(\.processIdentifier))
         }
 
-        for window in termiusWindows {
-            if let name = window[kCGWindowName as String] as? String, !name.isEmpty {
-                return name
+        var nameMatch: NSRunningApplication?
+        for app in apps where !app.isTerminated && !terminatedPIDs.contains(app.processIdentifier) {
+            if Self.hasKnownBundleID(app) {
+                return app
+            }
+            if nameMatch == nil && Self.matchesTermiusName(app) {
+                nameMatch = app
             }
         }
-
-        return termiusWindows.isEmpty ? nil : ""
+        return nameMatch
     }
 
-    /// Check if Termius has visible windows (even if we can't read their titles).
-    private func hasOnScreenWindows(pid: pid_t) -> Bool {
+    /// Get the title of the frontmost Termius window and whether any of its
+    /// windows are on screen, from a single CGWindowList snapshot.
+    ///
+    /// The list is read as `[NSDictionary]` so only the few fields we look at
+    /// are bridged, rather than converting every window of every app.
+    private func scanWindows(pid: pid_t) -> WindowScan {
         guard let windowList = CGWindowListCopyWindowInfo(
-            [.optionOnScreenOnly, .excludeDesktopElements],
+            [.optionAll, .excludeDesktopElements],
             kCGNullWindowID
-        ) as? [[String: Any]] else {
-            return false
+        ) as? [NSDictionary] else {
+            return WindowScan(title: nil, hasOnScreenWindows: false)
         }
 
-        return windowList.contains { info in
-            let ownerPID = info[kCGWindowOwnerPID as String] as? pid_t
-            let layer = info[kCGWindowLayer as String] as? Int
-            return ownerPID == pid && layer == 0
+        var hasTermiusWindows = false
+        var hasOnScreenWindows = false
+        var offScreenTitle: String?
+
+        // The list is ordered front to back, so the first on-screen window
+        // with a title wins; off-screen titles are only a fallback.
+        for info in windowList {
+            guard (info[Self.ownerPIDKey] as? pid_t) == pid,
+                  (info[Self.layerKey] as? Int) == 0 else { continue }
+            hasTermiusWindows = true
+
+            let name = info[Self.nameKey] as? String ?? ""
+            if (info[Self.isOnscreenKey] as? Bool) == true {
+                hasOnScreenWindows = true
+                if !name.isEmpty {
+                    return WindowScan(title: name, hasOnScreenWindows: true)
+                }
+            } else if offScreenTitle == nil && !name.isEmpty {
+                offScreenTitle = name
+            }
         }
+
+        return WindowScan(
+            title: offScreenTitle ?? (hasTermiusWindows ? "" : nil),
+            hasOnScreenWindows: hasOnScreenWindows
+        )
     }
 
     /// Show an alert guiding the user to grant Screen Recording permission.
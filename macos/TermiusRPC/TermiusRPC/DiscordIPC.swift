@@ -10,18 +10,18 @@ enum DiscordOpcode: UInt32 {
     case pong      = 4
 }
 
-struct DiscordActivity: Encodable {
+struct DiscordActivity: Encodable, Equatable {
     var state: String?
     var details: String?
     var timestamps: Timestamps?
     var assets: Assets?
 
-    struct Timestamps: Encodable {
+    struct Timestamps: Encodable, Equatable {
         var start: Int?
         var end: Int?
     }
 
-    struct Assets: Encodable {
+    struct Assets: Encodable, Equatable {
         var largeImage: String?
         var largeText: String?
         var smallImage: String?
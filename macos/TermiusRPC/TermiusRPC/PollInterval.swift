@@ -0,0 +1,29 @@
+import Foundation
+
+/// Poll interval that, when adaptive, backs off while nothing changes and
+/// snaps back to the configured interval as soon as the detected state
+/// changes. When not adaptive it always stays at the configured interval.
+struct AdaptivePollInterval {
+    static let maxBackoff: TimeInterval = 30
+    static let growthFactor = 1.5
+
+    let base: TimeInterval
+    let isAdaptive: Bool
+    private(set) var current: TimeInterval
+
+    init(base: TimeInterval, adaptive: Bool) {
+        self.base = base
+        self.isAdaptive = adaptive
+        self.current = base
+    }
+
+    /// Record the outcome of a poll. Returns the interval until the next one.
+    mutating func next(changed: Bool) -> TimeInterval {
+        if changed || !isAdaptive {
+            current = base
+        } else {
+            current = min(current * Self.growthFactor, max(base, Self.maxBackoff))
+        }
+        return current
+    }
+}
@@ -1,34 +1,68 @@
-import Foundation
+import AppKit
+import Combine
 
 final class PresenceController: ObservableObject {
     @Published var status: String = "Starting..."
     @Published var isDiscordConnected: Bool = false
 
     private let clientID = "1417890882702540911"
+
+    private static let idleAssets = DiscordActivity.Assets(
+        largeImage: "termius",
+        largeText: "Termius SSH Client"
+    )
+
+    private static let sessionAssets = DiscordActivity.Assets(
+        largeImage: "termius",
+        largeText: "Termius SSH Client",
+        smallImage: "ssh_icon",
+        smallText: "SSH"
+    )
+
     private let detector = TermiusDetector()
     private var discord: DiscordIPCClient?
     private var stateMachine = PresenceStateMachine()
+    private var sentPresence = SentPresence()
     private var pollTimer: Timer?
+    private var pollInterval = AdaptivePollInterval(base: 5, adaptive: false)
+    private var nextPollDate = Date()
+    private var workspaceObservers: [NSObjectProtocol] = []
     private var reconnectTimer: Timer?
+    private var isConnecting = false
+    private var isRunning = false
     private let configManager: ConfigManager
+    /// Snapshot of the config, refreshed whenever ConfigManager publishes a change.
+    private var config: AppConfig
+    private var configSubscription: AnyCancellable?
 
     init(configManager: ConfigManager) {
         self.configManager = configManager
+        self.config = configManager.config
     }
 
     func start() {
+        isRunning = true
         connectToDiscord()
+        observeConfig()
+        observeAppLaunches()
         startPolling()
     }
 
     func stop() {
+        isRunning = false
         pollTimer?.invalidate()
         pollTimer = nil
+        configSubscription = nil
+        for observer in workspaceObservers {
+            NSWorkspace.shared.notificationCenter.removeObserver(observer)
+        }
+        workspaceObservers = []
         reconnectTimer?.invalidate()
         reconnectTimer = nil
         try? discord?.clearPresence()
         discord?.disconnect()
         discord = nil
+        sentPresence.disconnected()
         isDiscordConnected = false
         status = "Stopped"
     }
@@ -36,19 +70,42 @@ final class PresenceController: ObservableObject {
     // MARK: - Discord Connection
 
     private func connectToDiscord() {
+        guard !isConnecting else { return }
+        isConnecting = true
+
+        // Trying the sockets and reading the handshake reply block, so keep
+        // them off the main thread and hand the result back to it.
         let client = DiscordIPCClient(clientID: clientID)
-        do {
-            try client.connect()
-            discord = client
-            isDiscordConnected = true
-            status = "Connected to Discord"
-            reconnectTimer?.invalidate()
-            reconnectTimer = nil
-        } catch {
+        DispatchQueue.global(qos: .utility).async { [weak self] in
+            let connected = (try? client.connect()) != nil
+            DispatchQueue.main.async {
+                self?.finishConnecting(client, connected: connected)
+            }
+        }
+    }
+
+    private func finishConnecting(_ client: DiscordIPCClient, connected: Bool) {
+        isConnecting = false
+        guard isRunning else {
+            client.disconnect()
+            return
+        }
+        guard connected else {
             isDiscordConnected = false
             status = "Discord not connected"
             scheduleReconnect()
+            return
         }
+
+        discord = client
+        sentPresence.connected()
+        isDiscordConnected = true
+        status = "Connected to Discord"
+        reconnectTimer?.invalidate()
+        reconnectTimer = nil
+
+        // Restore presence now rather than on the next, possibly backed-off, poll.
+        emit(buildActivity(for: stateMachine.currentState))
     }
 
     private func scheduleReconnect() {
@@ -61,43 +118,101 @@ final class PresenceController: ObservableObject {
     // MARK: - Polling
 
     private func startPolling() {
-        poll()
         pollTimer?.invalidate()
-        let interval = TimeInterval(configManager.config.clampedUpdateInterval)
-        pollTimer = Timer.scheduledTimer(withTimeInterval: interval, repeats: true) { [weak self] _ in
-            self?.poll()
+        pollInterval = AdaptivePollInterval(
+            base: TimeInterval(config.clampedUpdateInterval),
+            adaptive: config.adaptivePolling
+        )
+        nextPollDate = Date()
+        pollAndReschedule()
+    }
+
+    private func pollAndReschedule() {
+        let interval = pollInterval.next(changed: poll())
+
+        // Schedule from the previous deadline rather than from now, so slow
+        // polls don't stretch the period. The tolerance lets the system
+        // coalesce our wakeups.
+        nextPollDate = max(nextPollDate.addingTimeInterval(interval), Date())
+        let timer = Timer(fire: nextPollDate, interval: 0, repeats: false) { [weak self] _ in
+            self?.pollAndReschedule()
+        }
+        timer.tolerance = interval * 0.1
+        RunLoop.main.add(timer, forMode: .default)
+        pollTimer = timer
+    }
+
+    /// Pick up config changes and re-poll with them right away, so a new
+    /// interval or privacy setting applies without waiting for the next tick.
+    private func observeConfig() {
+        // dropFirst() skips the value current at subscribe time, so take it
+        // here in case the file watcher reloaded it since init.
+        config = configManager.config
+        configSubscription = configManager.$config
+            .removeDuplicates()
+            .dropFirst()
+            .sink { [weak self] newConfig in
+                self?.config = newConfig
+                self?.startPolling()
+            }
+    }
+
+    /// Poll right away when Termius launches or quits, so a backed-off
+    /// interval doesn't delay noticing it open or close.
+    private func observeAppLaunches() {
+        let center = NSWorkspace.shared.notificationCenter
+        let names = [
+            NSWorkspace.didLaunchApplicationNotification,
+            NSWorkspace.didTerminateApplicationNotification,
+        ]
+        workspaceObservers = names.map { name in
+            center.addObserver(forName: name, object: nil, queue: .main) { [weak self] notification in
+                guard let self,
+                      let app = notification.userInfo?[NSWorkspace.applicationUserInfoKey] as? NSRunningApplication,
+                      TermiusDetector.isTermius(app) else { return }
+
+                // The app may not report isTerminated yet; without this the
+                // poll would find no windows and report Termius as idle.
+                if name == NSWorkspace.didTerminateApplicationNotification {
+                    self.detector.processTerminated(app)
+                }
+                self.startPolling()
+            }
         }
     }
 
-    private func poll() {
+    /// Detect the current state and push it to Discord if needed.
+    /// Returns true if the detected state changed.
+    private func poll() -> Bool {
         let detected = detector.detect()
         let changed = stateMachine.update(with: detected)
 
         updateStatus(detected)
 
-        guard changed else { return }
-
-        guard let discord, isDiscordConnected else {
-            if detected != .closed {
-                connectToDiscord()
-            }
-            return
+        if discord == nil && changed && detected != .closed {
+            connectToDiscord()
         }
+        emit(buildActivity(for: detected))
+        return changed
+    }
+
+    /// Send an activity to Discord, or clear presence for nil. Does nothing
+    /// if it's what we last sent, so unchanged polls never touch the socket.
+    private func emit(_ activity: DiscordActivity?) {
+        guard let discord, let write = sentPresence.write(for: activity) else { return }
 
         do {
-            switch detected {
-            case .closed:
+            switch write {
+            case .set(let activity):
+                try discord.setPresence(activity)
+            case .clear:
                 try discord.clearPresence()
-            case .idle:
-                try discord.setPresence(buildIdleActivity())
-            case .ssh(let host):
-                try discord.setPresence(buildSSHActivity(host: host))
-            case .sftp:
-                try discord.setPresence(buildSFTPActivity())
             }
+            sentPresence.didSend(activity)
         } catch {
-            self.discord?.disconnect()
+            discord.disconnect()
             self.discord = nil
+            sentPresence.disconnected()
             isDiscordConnected = false
             status = "Discord disconnected"
             scheduleReconnect()
@@ -122,8 +237,20 @@ final class PresenceController: ObservableObject {
 
     // MARK: - Activity Builders
 
+    private func buildActivity(for state: TermiusState) -> DiscordActivity? {
+        switch state {
+        case .closed:
+            return nil
+        case .idle:
+            return buildIdleActivity()
+        case .ssh(let host):
+            return buildSSHActivity(host: host)
+        case .sftp:
+            return buildSFTPActivity()
+        }
+    }
+
     private func buildSSHActivity(host: String) -> DiscordActivity {
-        let config = configManager.config
         let displayHost: String
         if config.privacy.showHostname && !host.isEmpty {
             displayHost = "SSH to \(host)"
@@ -135,19 +262,18 @@ final class PresenceController: ObservableObject {
             state: displayHost,
             details: "Connected via Termius",
             timestamps: startTimestamp(),
-            assets: defaultAssets()
+            assets: Self.sessionAssets
         )
     }
 
     private func buildSFTPActivity() -> DiscordActivity {
-        let config = configManager.config
         let state = config.privacy.showSftpStatus ? "Browsing in SFTP" : "Idle"
 
         return DiscordActivity(
             state: state,
             details: "Connected via Termius",
             timestamps: startTimestamp(),
-            assets: defaultAssets()
+            assets: Self.sessionAssets
         )
     }
 
@@ -155,10 +281,7 @@ final class PresenceController: ObservableObject {
         DiscordActivity(
             state: "Idle",
             details: "Termius",
-            assets: DiscordActivity.Assets(
-                largeImage: "termius",
-                largeText: "Termius SSH Client"
-            )
+            assets: Self.idleAssets
         )
     }
 
@@ -166,13 +289,4 @@ final class PresenceController: ObservableObject {
         guard let start = stateMachine.stateStartTime else { return nil }
         return DiscordActivity.Timestamps(start: Int(start.timeIntervalSince1970))
     }
-
-    private func defaultAssets() -> DiscordActivity.Assets {
-        DiscordActivity.Assets(
-            largeImage: "termius",
-            largeText: "Termius SSH Client",
-            smallImage: "ssh_icon",
-            smallText: "SSH"
-        )
-    }
 }
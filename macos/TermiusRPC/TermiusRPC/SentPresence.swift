@@ -0,0 +1,39 @@
+import Foundation
+
+/// A write that has to go to Discord to make it show the wanted presence.
+enum PresenceWrite: Equatable {
+    case set(DiscordActivity)
+    case clear
+}
+
+/// Tracks what Discord is currently showing, and decides which writes are
+/// needed so unchanged payloads never reach the socket.
+struct SentPresence {
+    private(set) var isConnected = false
+    /// Activity Discord is showing; nil when it shows none.
+    private(set) var lastSent: DiscordActivity?
+
+    /// The write needed to show `activity` (nil meaning no presence), or nil
+    /// if there's nothing to send or no connection to send it on.
+    func write(for activity: DiscordActivity?) -> PresenceWrite? {
+        guard isConnected, activity != lastSent else { return nil }
+        if let activity {
+            return .set(activity)
+        }
+        return .clear
+    }
+
+    mutating func didSend(_ activity: DiscordActivity?) {
+        lastSent = activity
+    }
+
+    /// A fresh Discord connection starts with no presence.
+    mutating func connected() {
+        isConnected = true
+        lastSent = nil
+    }
+
+    mutating func disconnected() {
+        isConnected = false
+    }
+}
@@ -34,6 +34,13 @@ struct SettingsView: View {
                             in: 1...60
                         )
                     }
+
+                    Toggle("Poll less often while idle", isOn: Binding(
+                        get: { configManager.config.adaptivePolling },
+                        set: { newValue in
+                            configManager.updateConfig { $0.adaptivePolling = newValue }
+                        }
+                    ))
                 }
                 .padding(8)
             }
@@ -66,7 +73,7 @@ struct SettingsView: View {
             }
         }
         .padding(20)
-        .frame(width: 340, height: 320)
+        .frame(width: 340, height: 350)
     }
 
     private func toggleLaunchAtLogin(enabled: Bool) {
@@ -11,8 +11,12 @@ enum TitleParser {
         "sftp", "files"
     ]
 
-    private static let ipv4Pattern = #"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$"#
-    private static let ipv6Pattern = #"^[0-9a-fA-F:]+(%\w+)?$"#
+    private static let ipv4Regex = try! NSRegularExpression(
+        pattern: #"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$"#
+    )
+    private static let ipv6Regex = try! NSRegularExpression(
+        pattern: #"^[0-9a-fA-F:]+(%\w+)?$"#
+    )
 
     static func parse(_ title: String?) -> TermiusState {
         let raw = (title ?? "").trimmingCharacters(in: .whitespaces)
@@ -42,15 +46,15 @@ enum TitleParser {
 
     private static func extractMeaningfulPart(_ raw: String) -> String {
         // Try "Termius - <content>" prefix format first (macOS)
-        if raw.lowercased().hasPrefix("termius - ") {
-            let content = String(raw.dropFirst("Termius - ".count)).trimmingCharacters(in: .whitespaces)
+        if let prefix = raw.range(of: "termius - ", options: [.anchored, .caseInsensitive]) {
+            let content = raw[prefix.upperBound...].trimmingCharacters(in: .whitespaces)
             if !content.isEmpty { return content }
         }
 
         // Try "<content> - Termius" suffix format (Windows)
         if let dashRange = raw.range(of: " - ", options: .backwards) {
-            let suffix = raw[dashRange.upperBound...].trimmingCharacters(in: .whitespaces).lowercased()
-            if suffix == "termius" {
+            let suffix = raw[dashRange.upperBound...].trimmingCharacters(in: .whitespaces)
+            if suffix.caseInsensitiveCompare("termius") == .orderedSame {
                 let content = String(raw[..<dashRange.lowerBound]).trimmingCharacters(in: .whitespaces)
                 if !content.isEmpty { return content }
             }
@@ -76,12 +80,16 @@ enum TitleParser {
 
     private static func isIPAddress(_ str: String) -> Bool {
         let trimmed = str.trimmingCharacters(in: .whitespaces)
-        if trimmed.range(of: ipv4Pattern, options: .regularExpression) != nil {
+        if matches(ipv4Regex, trimmed) {
             return true
         }
-        if trimmed.contains(":") && trimmed.range(of: ipv6Pattern, options: .regularExpression) != nil {
+        if trimmed.contains(":") && matches(ipv6Regex, trimmed) {
             return true
         }
         return false
     }
+
+    private static func matches(_ regex: NSRegularExpression, _ str: String) -> Bool {
+        regex.firstMatch(in: str, range: NSRange(str.startIndex..., in: str)) != nil
+    }
 }
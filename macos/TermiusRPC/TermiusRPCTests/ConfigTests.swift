@@ -5,6 +5,7 @@ final class ConfigTests: XCTestCase {
     func testDefaultConfig() {
         let config = AppConfig.default
         XCTAssertEqual(config.updateIntervalSeconds, 5)
+        XCTAssertFalse(config.adaptivePolling)
         XCTAssertTrue(config.startOnLogin)
         XCTAssertTrue(config.privacy.showHostname)
         XCTAssertTrue(config.privacy.showSftpStatus)
@@ -14,6 +15,7 @@ final class ConfigTests: XCTestCase {
         let json = """
         {
             "update_interval_seconds": 10,
+            "adaptive_polling": true,
             "start_on_login": false,
             "privacy": {
                 "show_hostname": false,
@@ -24,6 +26,7 @@ final class ConfigTests: XCTestCase {
         let data = json.data(using: .utf8)!
         let config = try JSONDecoder().decode(AppConfig.self, from: data)
         XCTAssertEqual(config.updateIntervalSeconds, 10)
+        XCTAssertTrue(config.adaptivePolling)
         XCTAssertFalse(config.startOnLogin)
         XCTAssertFalse(config.privacy.showHostname)
         XCTAssertTrue(config.privacy.showSftpStatus)
@@ -45,6 +48,7 @@ final class ConfigTests: XCTestCase {
         let data = json.data(using: .utf8)!
         let config = try JSONDecoder().decode(AppConfig.self, from: data)
         XCTAssertEqual(config.updateIntervalSeconds, 3)
+        XCTAssertFalse(config.adaptivePolling)
         XCTAssertTrue(config.startOnLogin)
         XCTAssertTrue(config.privacy.showHostname)
         XCTAssertTrue(config.privacy.showSftpStatus)
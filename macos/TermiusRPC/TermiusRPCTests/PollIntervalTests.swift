@@ -0,0 +1,41 @@
+import XCTest
+@testable import TermiusRPC
+
+final class PollIntervalTests: XCTestCase {
+    func testStartsAtBase() {
+        let interval = AdaptivePollInterval(base: 5, adaptive: true)
+        XCTAssertEqual(interval.current, 5)
+    }
+
+    func testBacksOffWhileStable() {
+        var interval = AdaptivePollInterval(base: 5, adaptive: true)
+        XCTAssertEqual(interval.next(changed: false), 7.5)
+        XCTAssertEqual(interval.next(changed: false), 11.25)
+    }
+
+    func testBackoffIsCapped() {
+        var interval = AdaptivePollInterval(base: 5, adaptive: true)
+        for _ in 0..<20 {
+            _ = interval.next(changed: false)
+        }
+        XCTAssertEqual(interval.current, AdaptivePollInterval.maxBackoff)
+    }
+
+    func testChangeResetsToBase() {
+        var interval = AdaptivePollInterval(base: 5, adaptive: true)
+        _ = interval.next(changed: false)
+        _ = interval.next(changed: false)
+        XCTAssertEqual(interval.next(changed: true), 5)
+    }
+
+    func testBaseAboveCapIsKept() {
+        var interval = AdaptivePollInterval(base: 60, adaptive: true)
+        XCTAssertEqual(interval.next(changed: false), 60)
+    }
+
+    func testFixedIntervalNeverBacksOff() {
+        var interval = AdaptivePollInterval(base: 5, adaptive: false)
+        XCTAssertEqual(interval.next(changed: false), 5)
+        XCTAssertEqual(interval.next(changed: false), 5)
+    }
+}
@@ -0,0 +1,52 @@
+import XCTest
+@testable import TermiusRPC
+
+final class SentPresenceTests: XCTestCase {
+    private let ssh = DiscordActivity(state: "SSH to homelab", details: "Connected via Termius")
+    private let sftp = DiscordActivity(state: "Browsing in SFTP", details: "Connected via Termius")
+
+    private func connected() -> SentPresence {
+        var sent = SentPresence()
+        sent.connected()
+        return sent
+    }
+
+    func testNothingIsWrittenWhileDisconnected() {
+        let sent = SentPresence()
+        XCTAssertNil(sent.write(for: ssh))
+        XCTAssertNil(sent.write(for: nil))
+    }
+
+    func testFreshConnectionNeedsNoClear() {
+        let sent = connected()
+        XCTAssertNil(sent.write(for: nil))
+        XCTAssertEqual(sent.write(for: ssh), .set(ssh))
+    }
+
+    func testUnchangedActivityIsSkipped() {
+        var sent = connected()
+        sent.didSend(ssh)
+        XCTAssertNil(sent.write(for: ssh))
+    }
+
+    func testClosingClearsPresence() {
+        var sent = connected()
+        sent.didSend(ssh)
+        XCTAssertEqual(sent.write(for: nil), .clear)
+    }
+
+    func testSendsStopAfterDisconnect() {
+        var sent = connected()
+        sent.didSend(ssh)
+        sent.disconnected()
+        XCTAssertNil(sent.write(for: sftp))
+    }
+
+    func testReconnectResendsCurrentActivity() {
+        var sent = connected()
+        sent.didSend(ssh)
+        sent.disconnected()
+        sent.connected()
+        XCTAssertEqual(sent.write(for: ssh), .set(ssh))
+    }
+}